@@ -2,25 +2,44 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import os
+import shutil
 import logging
 from datetime import datetime
+from functools import cached_property
 import re
-from collections import defaultdict
 
 class ExpenseTracker:
     # Define a safe directory for storing files
     SAFE_DIRECTORY = os.getcwd()
+    # Rows per to_csv chunk and write buffer size used when saving
+    SAVE_CHUNK_SIZE = 50000
+    WRITE_BUFFER_SIZE = 1 << 20
+    # Files above this size are memory-mapped when read with the C engine
+    LARGE_FILE_BYTES = 10 * 1024 * 1024
+
+    # Date parsing rules, built once for every parse_date_input call
+    DATE_CLEAN_PATTERN = re.compile(r'[^0-9/.-]')
+    DATE_FORMATS = (
+        '%d-%m-%Y', '%d/%m/%Y', '%d.%m.%Y',  # Day-Month-Year
+        '%m-%d-%Y', '%m/%d/%Y', '%m.%d.%Y',  # Month-Day-Year
+        '%Y-%m-%d', '%Y/%m/%d', '%Y.%m.%d',  # Year-Month-Day
+        '%m-%Y', '%m/%Y', '%m.%Y',           # Month-Year
+        '%Y-%m', '%Y/%m', '%Y.%m'            # Year-Month
+    )
+    MONTH_ONLY_FORMATS = frozenset(['%m-%Y', '%m/%Y', '%m.%Y', '%Y-%m', '%Y/%m', '%Y.%m'])
 
     def __init__(self, filename='expenses.csv'):
         # Initialize the tracker with a filename
         self.fasafe_file_path = self.make_safe_file_path(filename)
+        self.parquet_cache_path = self.fasafe_file_path + '.parquet'
         self.setup_logging_system()
         self.logger.info(f"Using data file: {os.path.basename(self.fasafe_file_path)}")
         
-        # Load expense data and setup category normalization
+        # Load expense data; categories are normalized on first use
+        self.categories_normalized = False
         self.expense_data = self.load_expense_data()
-        self.category_name_mapping = self.build_category_name_mapping()
-        self.normalize_all_categories()
+        self.expense_month_index = None
+        self.pending_expenses = []
 
     def setup_logging_system(self):
         # Configure logging for tracking events
@@ -45,18 +64,50 @@ class ExpenseTracker:
                 self.logger.info("Creating new expense file")
                 return pd.DataFrame(columns=['Date', 'Category', 'Amount', 'Description'])
 
-            # Read CSV file
-            expense_dataframe = pd.read_csv(self.fasafe_file_path)
-            
+            # Reuse the Parquet copy from the last save if the CSV is unchanged since
+            cached_dataframe = self.load_parquet_cache()
+            if cached_dataframe is not None:
+                # Saved data always has normalized categories
+                self.categories_normalized = True
+                self.logger.info(f"Loaded {len(cached_dataframe)} expense records from cache")
+                return cached_dataframe
+
+            # Store each distinct category once, and descriptions in Arrow
+            # string buffers rather than one Python object per row when possible
+            description_type = self.get_description_dtype()
+
+            # Read CSV file, preferring the multithreaded PyArrow reader. Its
+            # date_format parser rolls impossible dates such as 31-04 over into
+            # the next month, so dates are only parsed while reading on the C
+            # engine, in the DD-MM-YYYY layout we save them in
+            column_types = {'Category': 'category', 'Description': description_type}
+            try:
+                expense_dataframe = self.read_csv_with_pyarrow()
+                expense_dataframe = expense_dataframe.astype(
+                    {column: dtype for column, dtype in column_types.items() if column in expense_dataframe}
+                )
+            except (ImportError, ValueError):
+                # Memory-map large files so the C parser reads them without extra copies
+                is_large_file = os.path.getsize(self.fasafe_file_path) > self.LARGE_FILE_BYTES
+                expense_dataframe = pd.read_csv(
+                    self.fasafe_file_path, engine='c', low_memory=False, memory_map=is_large_file,
+                    dtype=column_types, parse_dates=['Date'], date_format='%d-%m-%Y', cache_dates=True
+                )
+
             # Convert amounts to numbers
             expense_dataframe['Amount'] = pd.to_numeric(expense_dataframe['Amount'], errors='coerce')
             
-            # Parse dates using our flexible parser
-            expense_dataframe['Date'] = expense_dataframe['Date'].apply(self.parse_date_input)
-            
+            # Dates still held as text are parsed format by format in the same
+            # order as parse_date_input, starting with DD-MM-YYYY
+            if not pd.api.types.is_datetime64_any_dtype(expense_dataframe['Date']):
+                expense_dataframe['Date'] = self.parse_date_column(expense_dataframe['Date'])
+
             # Clean data: remove invalid entries
             expense_dataframe = expense_dataframe.dropna(subset=['Date', 'Amount'])
             expense_dataframe = expense_dataframe[expense_dataframe['Amount'] > 0]
+
+            # Expense dates only need second resolution
+            expense_dataframe['Date'] = expense_dataframe['Date'].astype('datetime64[s]')
             
             self.logger.info(f"Loaded {len(expense_dataframe)} expense records")
             return expense_dataframe
@@ -64,35 +115,101 @@ class ExpenseTracker:
             self.logger.error(f"Error loading file: {error}")
             return pd.DataFrame(columns=['Date', 'Category', 'Amount', 'Description'])
 
+    def get_description_dtype(self):
+        # Arrow-backed strings when pyarrow is installed, pandas strings otherwise
+        try:
+            return pd.StringDtype('pyarrow')
+        except ImportError:
+            return pd.StringDtype()
+
+    def read_csv_with_pyarrow(self):
+        # Read with PyArrow, declaring text columns as strings up front so values
+        # such as 01 or 1e3 are never inferred as numbers
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        convert_options = pa_csv.ConvertOptions(
+            column_types={'Date': pa.string(), 'Category': pa.string(), 'Description': pa.string()},
+            # Same missing-value markers as pandas.read_csv
+            null_values=pa_csv.ConvertOptions().null_values + ['<NA>', 'None'],
+            strings_can_be_null=True
+        )
+        return pa_csv.read_csv(self.fasafe_file_path, convert_options=convert_options).to_pandas()
+
+    @cached_property
+    def category_name_mapping(self):
+        # Built on first access, then updated in place as categories are added
+        return self.build_category_name_mapping()
+
+    def load_parquet_cache(self):
+        # Read the Parquet copy when it is at least as new as the CSV (requires pyarrow)
+        if not os.path.exists(self.parquet_cache_path):
+            return None
+        if os.path.getmtime(self.parquet_cache_path) < os.path.getmtime(self.fasafe_file_path):
+            return None
+
+        try:
+            cached_dataframe = pd.read_parquet(self.parquet_cache_path)
+            cached_dataframe['Date'] = cached_dataframe['Date'].astype('datetime64[s]')
+            # Parquet restores descriptions as python-backed strings on some pandas versions
+            cached_dataframe['Description'] = cached_dataframe['Description'].astype(self.get_description_dtype())
+            return cached_dataframe
+        except ImportError:
+            return None
+        except Exception as error:
+            self.logger.warning(f"Ignoring unreadable cache file: {error}")
+            return None
+
+    def save_parquet_cache(self):
+        # Write a Parquet copy of the data for faster reloads (requires pyarrow)
+        try:
+            self.expense_data.to_parquet(self.parquet_cache_path, compression='zstd', index=False)
+            # The cache holds the same data, so give it the CSV's permissions
+            if os.path.exists(self.fasafe_file_path):
+                shutil.copymode(self.fasafe_file_path, self.parquet_cache_path)
+        except ImportError:
+            return
+        except Exception as error:
+            self.logger.warning(f"Could not write cache file: {error}")
+            # Never leave a partial cache that looks newer than the CSV
+            try:
+                if os.path.exists(self.parquet_cache_path):
+                    os.remove(self.parquet_cache_path)
+            except OSError as cleanup_error:
+                self.logger.warning(f"Could not remove cache file: {cleanup_error}")
+
     def build_category_name_mapping(self):
         # Create mapping for consistent category naming
         name_mapping = {}
         if not self.expense_data.empty and 'Category' in self.expense_data.columns:
-            # Count different name variations
-            name_variations = defaultdict(lambda: defaultdict(int))
-            for category_name in self.expense_data['Category']:
-                if pd.isna(category_name):
-                    continue
-                    
-                clean_name = str(category_name).strip().lower()
-                original_name = str(category_name).strip()
-                name_variations[clean_name][original_name] += 1
-            
-            # Use most common variation for each category
-            for clean_name, variations in name_variations.items():
-                most_common_name = max(variations.items(), key=lambda x: x[1])[0]
-                name_mapping[clean_name] = most_common_name
-                
+            # Count different name variations in one grouped pass
+            original_names = self.expense_data['Category'].dropna().astype(str).str.strip()
+            name_variations = pd.DataFrame({
+                'clean_name': original_names.str.lower(),
+                'original_name': original_names
+            }).groupby(['clean_name', 'original_name'], sort=False).size()
+
+            # Use most common variation for each category (first seen wins ties)
+            most_common = name_variations.groupby(level='clean_name', sort=False).idxmax()
+            name_mapping = dict(most_common.tolist())
+
         return name_mapping
 
     def normalize_all_categories(self):
         # Apply consistent naming to all categories
         if not self.expense_data.empty and 'Category' in self.expense_data.columns:
-            self.expense_data['Category'] = self.expense_data['Category'].apply(
-                lambda category: self.normalize_category_name(category)
-            )
+            # Vectorized equivalent of normalize_category_name
+            category_names = self.expense_data['Category'].astype('string').str.strip()
+            mapped_names = category_names.str.lower().map(self.category_name_mapping)
+            self.expense_data['Category'] = mapped_names.fillna(category_names).astype('category')
             self.logger.info("Standardized category names")
 
+    def ensure_categories_normalized(self):
+        # Normalize category names once, only for operations that need them
+        if not self.categories_normalized:
+            self.normalize_all_categories()
+            self.categories_normalized = True
+
     def normalize_category_name(self, category_name):
         # Convert category name to standardized form
         if pd.isna(category_name):
@@ -102,72 +219,120 @@ class ExpenseTracker:
         lowercase_name = clean_name.lower()
         return self.category_name_mapping.get(lowercase_name, clean_name)
 
+    def flush_pending_expenses(self):
+        # Add buffered expenses to the data in a single concat
+        if not self.pending_expenses:
+            return
+
+        new_records = pd.DataFrame(self.pending_expenses)
+        new_records['Date'] = new_records['Date'].astype('datetime64[s]')
+        if self.expense_data.empty:
+            new_records['Category'] = new_records['Category'].astype('category')
+            new_records['Description'] = new_records['Description'].astype(self.get_description_dtype())
+            self.expense_data = new_records
+        else:
+            # Share one categorical dtype so concat keeps Category as a category
+            category_column = self.expense_data['Category']
+            if isinstance(category_column.dtype, pd.CategoricalDtype):
+                all_categories = category_column.cat.categories.union(new_records['Category'].unique())
+                self.expense_data['Category'] = category_column.cat.set_categories(all_categories)
+                new_records['Category'] = pd.Categorical(new_records['Category'], categories=all_categories)
+            new_records['Description'] = new_records['Description'].astype(self.expense_data['Description'].dtype)
+            self.expense_data = pd.concat([self.expense_data, new_records], ignore_index=True)
+
+        self.pending_expenses.clear()
+        self.expense_month_index = None
+
     def save_expense_data(self):
         # Save data to CSV file
+        self.flush_pending_expenses()
+        self.ensure_categories_normalized()
+        # Write next to the real file so a symlinked CSV stays a symlink
+        data_file_path = os.path.realpath(self.fasafe_file_path)
+        temporary_path = data_file_path + '.tmp'
         try:
-            # Prepare data for saving
-            data_to_save = self.expense_data.copy()
-            
-            # Format dates as DD-MM-YYYY for storage
-            data_to_save['Date'] = data_to_save['Date'].apply(
-                lambda date: date.strftime('%d-%m-%Y') if isinstance(date, datetime) else date
-            )
-            
-            # Save to CSV
-            data_to_save.to_csv(self.fasafe_file_path, index=False)
+            # Stream to a temporary UTF-8 CSV in chunks, letting pandas format dates as DD-MM-YYYY
+            with open(temporary_path, 'w', encoding='utf-8', newline='',
+                      buffering=self.WRITE_BUFFER_SIZE) as csv_file:
+                self.expense_data.to_csv(
+                    csv_file,
+                    index=False,
+                    date_format='%d-%m-%Y',
+                    chunksize=self.SAVE_CHUNK_SIZE,
+                    lineterminator='\n'
+                )
+
+            # Keep the existing file's permissions, then swap the finished file
+            # in so a failed save never truncates the data
+            if os.path.exists(data_file_path):
+                shutil.copymode(data_file_path, temporary_path)
+            os.replace(temporary_path, data_file_path)
+            self.save_parquet_cache()
             self.logger.info(f"Data saved to {os.path.basename(self.fasafe_file_path)}")
             return True
         except Exception as error:
             self.logger.error(f"Error saving file: {error}")
+            try:
+                if os.path.exists(temporary_path):
+                    os.remove(temporary_path)
+            except OSError as cleanup_error:
+                self.logger.warning(f"Could not remove temporary file: {cleanup_error}")
             return False
 
     def display_spending_summary(self):
         # Show overview of spending
+        self.flush_pending_expenses()
         if self.expense_data.empty:
             self.logger.info("No expenses to display")
             print("\nNo expenses found")
             return
 
-        total_spent = self.expense_data['Amount'].sum()
-        highest_expense = self.expense_data.loc[self.expense_data['Amount'].idxmax()]
-        lowest_expense = self.expense_data.loc[self.expense_data['Amount'].idxmin()]
+        amount_stats = self.scan_expense_amounts()
+        total_spent = amount_stats['sum']
+
+        # Gather both extreme rows with a single positional lookup
+        extreme_expenses = self.expense_data.iloc[[amount_stats['argmax'], amount_stats['argmin']]]
+        highest_expense = extreme_expenses.iloc[0]
+        lowest_expense = extreme_expenses.iloc[1]
 
         print("\n===== SPENDING SUMMARY =====")
         print(f"Total Expenses: ${total_spent:.2f}")
         
         print("\nMost Expensive Item:")
         print(f"  Date: {highest_expense['Date'].strftime('%d-%m-%Y')}")
-        print(f"  Category: {highest_expense['Category']}")
+        print(f"  Category: {self.normalize_category_name(highest_expense['Category'])}")
         print(f"  Amount: ${highest_expense['Amount']:.2f}")
         print(f"  Description: {highest_expense['Description']}")
         
         print("\nLeast Expensive Item:")
         print(f"  Date: {lowest_expense['Date'].strftime('%d-%m-%Y')}")
-        print(f"  Category: {lowest_expense['Category']}")
+        print(f"  Category: {self.normalize_category_name(lowest_expense['Category'])}")
         print(f"  Amount: ${lowest_expense['Amount']:.2f}")
         print(f"  Description: {lowest_expense['Description']}")
         print("=" * 40)
 
+    def scan_expense_amounts(self):
+        # Compute total and extreme positions straight from the Amount array
+        amounts = self.expense_data['Amount'].to_numpy(dtype=np.float64)
+        return {'sum': amounts.sum(), 'argmin': amounts.argmin(), 'argmax': amounts.argmax()}
+
     def analyze_categories(self):
         # Analyze spending by category
+        self.flush_pending_expenses()
+        self.ensure_categories_normalized()
         if self.expense_data.empty:
             self.logger.info("No expenses to analyze")
             print("\nNo expenses to analyze")
             return pd.DataFrame()
 
-        # Group expenses by category
-        grouped_by_category = self.expense_data.groupby('Category')
-        category_totals = grouped_by_category['Amount'].sum()
-        transaction_counts = grouped_by_category.size()
-        overall_spending = category_totals.sum()
-        spending_percentages = (category_totals / overall_spending * 100).round(2)
+        # Total and count each category in a single grouped pass
+        category_report = self.expense_data.groupby('Category', observed=True)['Amount'].agg(['sum', 'size'])
+        category_report.columns = ['Total Amount', 'Transaction Count']
+        overall_spending = category_report['Total Amount'].sum()
+        category_report['Percentage (%)'] = (category_report['Total Amount'] / overall_spending * 100).round(2)
 
         # Create summary report
-        category_report = pd.DataFrame({
-            'Total Amount': category_totals,
-            'Transaction Count': transaction_counts,
-            'Percentage (%)': spending_percentages
-        }).sort_values('Total Amount', ascending=False)
+        category_report = category_report.sort_values('Total Amount', ascending=False)
 
         print("\n===== CATEGORY ANALYSIS =====")
         print(category_report.to_string(float_format='%.2f'))
@@ -176,6 +341,8 @@ class ExpenseTracker:
 
     def create_category_pie_chart(self):
         # Visualize spending distribution
+        self.flush_pending_expenses()
+        self.ensure_categories_normalized()
         if self.expense_data.empty:
             self.logger.info("No data for chart")
             return
@@ -197,8 +364,7 @@ class ExpenseTracker:
 
     def filter_expenses(self, start_date=None, end_date=None, target_month=None):
         # Filter expenses by date range or month
-        expense_copy = self.expense_data.copy()
-        
+        self.flush_pending_expenses()
         if target_month:
             try:
                 # Parse month input
@@ -207,9 +373,11 @@ class ExpenseTracker:
                     print("Invalid month format. Use formats like YYYY-MM or MM-YYYY")
                     return pd.DataFrame()
                     
-                # Convert to monthly period
-                month_period = month_date.to_period('M')
-                return expense_copy[expense_copy['Date'].dt.to_period('M') == month_period]
+                # Binary search the month's rows in the sorted month index
+                month_key = month_date.year * 100 + month_date.month
+                sorted_month_keys, row_positions = self.get_expense_month_index()
+                first, last = np.searchsorted(sorted_month_keys, [month_key, month_key + 1])
+                return self.expense_data.iloc[row_positions[first:last]]
             except Exception as error:
                 self.logger.error(f"Month filter error: {error}")
                 return pd.DataFrame()
@@ -228,17 +396,42 @@ class ExpenseTracker:
                 return pd.DataFrame()
                 
             try:
-                # Apply date range filter
+                # Build one date range mask and select matching rows
+                date_mask = pd.Series(True, index=self.expense_data.index)
                 if parsed_start:
-                    expense_copy = expense_copy[expense_copy['Date'] >= parsed_start]
+                    date_mask &= self.expense_data['Date'] >= parsed_start
                 if parsed_end:
-                    expense_copy = expense_copy[expense_copy['Date'] <= parsed_end]
-                return expense_copy
+                    date_mask &= self.expense_data['Date'] <= parsed_end
+                return self.expense_data.loc[date_mask]
             except Exception as error:
                 self.logger.error(f"Date range filter error: {error}")
                 return pd.DataFrame()
                 
-        return expense_copy
+        return self.expense_data
+
+    def get_expense_month_index(self):
+        # Sort row positions by YYYYMM key once and reuse until the data changes
+        if self.expense_month_index is None or len(self.expense_month_index[1]) != len(self.expense_data):
+            expense_dates = self.expense_data['Date']
+            month_keys = (expense_dates.dt.year * 100 + expense_dates.dt.month).to_numpy()
+            row_positions = np.argsort(month_keys, kind='stable')
+            self.expense_month_index = (month_keys[row_positions], row_positions)
+        return self.expense_month_index
+
+    def parse_date_column(self, date_column):
+        # Convert a whole column of dates, trying formats in parse_date_input's order
+        clean_dates = date_column.astype(str).str.replace(self.DATE_CLEAN_PATTERN, '', regex=True)
+        parsed_dates = pd.Series(pd.NaT, index=date_column.index, dtype='datetime64[s]')
+
+        # Each format only sees the rows no earlier format could parse
+        for fmt in self.DATE_FORMATS:
+            unparsed = parsed_dates.isna()
+            if not unparsed.any():
+                break
+            format_dates = pd.to_datetime(clean_dates[unparsed], format=fmt, errors='coerce', cache=True)
+            # Unlike strptime, pandas accepts empty, zero and negative years
+            parsed_dates[unparsed] = format_dates.where(format_dates.dt.year >= 1)
+        return parsed_dates
 
     def parse_date_input(self, date_input):
         """Convert various date formats to datetime objects"""
@@ -255,23 +448,19 @@ class ExpenseTracker:
             return None
             
         # Clean input by removing non-date characters
-        clean_input = re.sub(r'[^0-9/.-]', '', str(date_input))
-        
-        # Supported date formats
-        date_formats = [
-            '%d-%m-%Y', '%d/%m/%Y', '%d.%m.%Y',  # Day-Month-Year
-            '%m-%d-%Y', '%m/%d/%Y', '%m.%d.%Y',  # Month-Day-Year
-            '%Y-%m-%d', '%Y/%m/%d', '%Y.%m.%d',  # Year-Month-Day
-            '%m-%Y', '%m/%Y', '%m.%Y',           # Month-Year
-            '%Y-%m', '%Y/%m', '%Y.%m'            # Year-Month
-        ]
+        clean_input = self.DATE_CLEAN_PATTERN.sub('', str(date_input))
+
+        # Resolve common layouts directly, without trial parsing
+        date_object = self.parse_date_parts(clean_input)
+        if date_object:
+            return date_object
         
-        # Try each format until successful
-        for fmt in date_formats:
+        # Fall back to trying each supported format
+        for fmt in self.DATE_FORMATS:
             try:
                 date_object = datetime.strptime(clean_input, fmt)
                 # Handle month-only formats
-                if fmt in ['%m-%Y', '%m/%Y', '%m.%Y', '%Y-%m', '%Y/%m', '%Y.%m']:
+                if fmt in self.MONTH_ONLY_FORMATS:
                     return date_object.replace(day=1)
                 return date_object
             except ValueError:
@@ -280,6 +469,39 @@ class ExpenseTracker:
         self.logger.warning(f"Unrecognized date format: {date_input}")
         return None
 
+    def parse_date_parts(self, clean_input):
+        # Pick the date layout from its separator and part lengths
+        separators = [separator for separator in '-/.' if separator in clean_input]
+        if len(separators) != 1:
+            return None
+
+        parts = clean_input.split(separators[0])
+        if not all(part.isdigit() for part in parts):
+            return None
+        lengths = [len(part) for part in parts]
+
+        try:
+            if len(parts) == 3:
+                # Year-Month-Day
+                if lengths[0] == 4 and lengths[1] <= 2 and lengths[2] <= 2:
+                    return datetime(int(parts[0]), int(parts[1]), int(parts[2]))
+                # Day-Month-Year, or Month-Day-Year when the day-first read is invalid
+                if lengths[0] <= 2 and lengths[1] <= 2 and lengths[2] == 4:
+                    year, first, second = int(parts[2]), int(parts[0]), int(parts[1])
+                    try:
+                        return datetime(year, second, first)
+                    except ValueError:
+                        return datetime(year, first, second)
+            elif len(parts) == 2:
+                # Month-Year or Year-Month, pinned to the first day
+                if lengths[0] <= 2 and lengths[1] == 4:
+                    return datetime(int(parts[1]), int(parts[0]), 1)
+                if lengths[0] == 4 and lengths[1] <= 2:
+                    return datetime(int(parts[0]), int(parts[1]), 1)
+        except ValueError:
+            pass
+        return None
+
     def add_new_expense(self):
         # Get expense details from user
         input_date = input("Enter date (DD-MM-YYYY, MM/DD/YYYY, or YYYY.MM.DD): ")
@@ -310,6 +532,7 @@ class ExpenseTracker:
             return
 
         # Normalize category name
+        self.ensure_categories_normalized()
         normalized_category = self.normalize_category_name(input_category)
         
         # Update mapping for new categories
@@ -317,17 +540,14 @@ class ExpenseTracker:
         if category_key not in self.category_name_mapping:
             self.category_name_mapping[category_key] = normalized_category
         
-        # Create new expense record
-        new_record = pd.DataFrame({
-            'Date': [expense_date],
-            'Category': [normalized_category],
-            'Amount': [expense_amount],
-            'Description': [input_description]
+        # Buffer new expense record until the data is next read or saved
+        self.pending_expenses.append({
+            'Date': expense_date,
+            'Category': normalized_category,
+            'Amount': expense_amount,
+            'Description': input_description
         })
         
-        # Add to expense data
-        self.expense_data = pd.concat([self.expense_data, new_record], ignore_index=True)
-        
         print(f"Added: {expense_date.strftime('%d-%m-%Y')}, {normalized_category}, ${expense_amount:.2f}")
         
         # Prompt to save
@@ -342,6 +562,7 @@ class ExpenseTracker:
 
     def export_analysis_report(self):
         # Export category analysis to CSV
+        self.flush_pending_expenses()
         if self.expense_data.empty:
             print("No data to export")
             return
@@ -386,6 +607,7 @@ class ExpenseTracker:
                 self.export_analysis_report()
             elif user_choice == '7':
                 # Exit with save option
+                self.flush_pending_expenses()
                 if not self.expense_data.empty:
                     save_first = input("Save changes before exiting? (y/n): ").lower()
                     if save_first == 'y':
@@ -419,10 +641,17 @@ class ExpenseTracker:
         if filtered_data.empty:
             print("No matching records found")
         else:
-            # Format dates for display
-            display_data = filtered_data.copy()
-            display_data['Date'] = display_data['Date'].dt.strftime('%d-%m-%Y')
-            print(display_data.to_string(index=False))
+            # Print rows straight from the column arrays, formatting only the dates
+            # and showing each category under its standardized name
+            dates = filtered_data['Date'].dt.strftime('%d-%m-%Y').to_numpy()
+            categories = filtered_data['Category'].map(self.normalize_category_name).to_numpy()
+            amounts = filtered_data['Amount'].to_numpy()
+            descriptions = filtered_data['Description'].to_numpy()
+
+            print(f"{'Date':<10}  {'Category':<15}  {'Amount':>11}  Description")
+            for date, category, amount, description in zip(dates, categories, amounts, descriptions):
+                amount_text = f"${amount:.2f}"
+                print(f"{date:<10}  {str(category):<15}  {amount_text:>11}  {description}")
 
 # Application entry point
 if __name__ == "__main__":
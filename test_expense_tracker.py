@@ -0,0 +1,109 @@
+import pandas as pd
+import pytest
+
+import expense_tracker
+
+
+@pytest.fixture(params=['pyarrow', 'c'])
+def load_tracker(request, tmp_path, monkeypatch):
+    # Load a CSV through either the PyArrow reader or the C engine fallback
+    if request.param == 'pyarrow':
+        pytest.importorskip('pyarrow')
+    else:
+        def read_csv_without_pyarrow(tracker):
+            raise ImportError('pyarrow disabled for this test')
+        monkeypatch.setattr(expense_tracker.ExpenseTracker, 'read_csv_with_pyarrow', read_csv_without_pyarrow)
+    monkeypatch.setattr(expense_tracker.ExpenseTracker, 'SAFE_DIRECTORY', str(tmp_path))
+
+    def load(csv_text):
+        (tmp_path / 'expenses.csv').write_text(csv_text, encoding='utf-8')
+        return expense_tracker.ExpenseTracker('expenses.csv')
+    return load
+
+
+def test_impossible_dates_are_dropped(load_tracker):
+    tracker = load_tracker(
+        'Date,Category,Amount,Description\n'
+        '31-04-2025,Food,1,a\n'
+        '29-02-2025,Food,2,b\n'
+        '30-02-2025,Food,3,c\n'
+        '31-06-2025,Food,4,d\n'
+        '10-06-2025,Food,5,e\n'
+        '29-02-2024,Food,6,f\n'
+    )
+    loaded_dates = dict(zip(tracker.expense_data['Description'],
+                            tracker.expense_data['Date'].dt.strftime('%d-%m-%Y')))
+    assert loaded_dates == {'e': '10-06-2025', 'f': '29-02-2024'}
+
+
+def test_text_columns_are_not_inferred(load_tracker):
+    tracker = load_tracker(
+        'Date,Category,Amount,Description\n'
+        '10-06-2025,01,1,0012\n'
+        '11-06-2025,02,2,1e3\n'
+        '12-06-2025,03,3,true\n'
+    )
+    assert list(tracker.expense_data['Category'].astype(str)) == ['01', '02', '03']
+    assert list(tracker.expense_data['Description']) == ['0012', '1e3', 'true']
+
+
+def test_save_keeps_file_mode_and_symlink(tmp_path, monkeypatch):
+    monkeypatch.setattr(expense_tracker.ExpenseTracker, 'SAFE_DIRECTORY', str(tmp_path))
+    real_file = tmp_path / 'real.csv'
+    real_file.write_text('Date,Category,Amount,Description\n10-06-2025,Food,1,a\n', encoding='utf-8')
+    real_file.chmod(0o600)
+    (tmp_path / 'expenses.csv').symlink_to(real_file)
+
+    tracker = expense_tracker.ExpenseTracker('expenses.csv')
+    assert tracker.save_expense_data()
+    assert (tmp_path / 'expenses.csv').is_symlink()
+    assert real_file.stat().st_mode & 0o777 == 0o600
+
+
+def test_parquet_cache_gets_csv_file_mode(tmp_path, monkeypatch):
+    pytest.importorskip('pyarrow')
+    monkeypatch.setattr(expense_tracker.ExpenseTracker, 'SAFE_DIRECTORY', str(tmp_path))
+    data_file = tmp_path / 'expenses.csv'
+    data_file.write_text('Date,Category,Amount,Description\n10-06-2025,Food,1,a\n', encoding='utf-8')
+    data_file.chmod(0o600)
+
+    tracker = expense_tracker.ExpenseTracker('expenses.csv')
+    assert tracker.save_expense_data()
+    assert (tmp_path / 'expenses.csv.parquet').stat().st_mode & 0o777 == 0o600
+
+
+def test_printed_categories_use_standardized_names(load_tracker, capsys, monkeypatch):
+    tracker = load_tracker(
+        'Date,Category,Amount,Description\n'
+        '10-06-2025, Food ,9,a\n'
+        '11-06-2025,food,5,b\n'
+        '12-06-2025,food,1,c\n'
+    )
+    tracker.display_spending_summary()
+    answers = iter(['2', '2025-06'])
+    monkeypatch.setattr('builtins.input', lambda prompt: next(answers))
+    tracker.show_filter_menu()
+    output = capsys.readouterr().out
+    assert 'Category: food' in output
+    assert 'Food' not in output
+    assert output.count('food ') == 3
+
+
+def test_description_dtype_matches_after_reload_and_new_file(tmp_path, monkeypatch):
+    pytest.importorskip('pyarrow')
+    monkeypatch.setattr(expense_tracker.ExpenseTracker, 'SAFE_DIRECTORY', str(tmp_path))
+    (tmp_path / 'expenses.csv').write_text('Date,Category,Amount,Description\n10-06-2025,Food,1,a\n',
+                                           encoding='utf-8')
+
+    tracker = expense_tracker.ExpenseTracker('expenses.csv')
+    expected_dtype = tracker.expense_data['Description'].dtype
+    assert tracker.save_expense_data()
+    reloaded_tracker = expense_tracker.ExpenseTracker('expenses.csv')
+    assert reloaded_tracker.expense_data['Description'].dtype == expected_dtype
+
+    new_tracker = expense_tracker.ExpenseTracker('new_expenses.csv')
+    new_tracker.pending_expenses.append(
+        {'Date': pd.Timestamp('2025-06-11'), 'Category': 'Food', 'Amount': 2.0, 'Description': 'b'}
+    )
+    new_tracker.flush_pending_expenses()
+    assert new_tracker.expense_data['Description'].dtype == expected_dtype